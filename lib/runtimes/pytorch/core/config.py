@@ -8,11 +8,50 @@ from typing import Dict, Any
 import yaml
 import os
 
+# Use the libyaml C loader when the binding is available - same output,
+# several times faster than the pure-Python parser
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+def load_yaml_cached(yaml_path: Path) -> Dict[str, Any]:
+    """Load a YAML file through an mtime-checked JSON sidecar cache
+
+    Parses the YAML once and writes the result next to it as
+    '<name>.cache.json'. Later loads reuse the JSON (much faster to
+    parse) as long as the source file has not been modified since.
+    Falls back to a plain parse if the cache cannot be written.
+    """
+    import json
+
+    cache_path = yaml_path.with_name(yaml_path.name + '.cache.json')
+
+    try:
+        if cache_path.stat().st_mtime >= yaml_path.stat().st_mtime:
+            with open(cache_path, 'r') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass  # Missing or corrupt cache - reparse below
+
+    with open(yaml_path, 'r') as f:
+        data = yaml.load(f, Loader=_YamlLoader) or {}
+
+    try:
+        with open(cache_path, 'w') as f:
+            json.dump(data, f)
+    except (OSError, TypeError):
+        pass  # Read-only dir or non-JSON values - cache is best-effort
+
+    return data
+
 
 class Config:
     """Configuration manager - single source of truth"""
     
     def __init__(self, config_dir: Path):
+        self._export_keys = None
         self.config_dir = Path(config_dir)
         self.framework_root = Path.home() / "WORKSPACE" / "ai" / "setups" / "framework"
         self._load_defaults()
@@ -89,11 +128,10 @@ class Config:
         rc_file = self.config_dir / ".frameworkrc"
         if rc_file.exists():
             try:
-                with open(rc_file, 'r') as f:
-                    overrides = yaml.safe_load(f) or {}
-                    for key, value in overrides.items():
-                        if hasattr(self, key.upper()):
-                            setattr(self, key.upper(), value)
+                overrides = load_yaml_cached(rc_file)
+                for key, value in overrides.items():
+                    if hasattr(self, key.upper()):
+                        setattr(self, key.upper(), value)
             except Exception as e:
                 print(f"Warning: Could not load .frameworkrc: {e}")
     
@@ -116,10 +154,14 @@ class Config:
     
     def to_dict(self) -> Dict[str, Any]:
         """Export config as dictionary"""
-        return {
-            k: v for k, v in self.__dict__.items()
-            if not k.startswith('_') and k.isupper()
-        }
+        # The exported key set is fixed once init completes - scan
+        # __dict__ a single time and reuse the layout on later exports
+        if self._export_keys is None:
+            self._export_keys = tuple(
+                k for k in self.__dict__
+                if not k.startswith('_') and k.isupper()
+            )
+        return {k: getattr(self, k) for k in self._export_keys}
     
     def __repr__(self) -> str:
         return f"<Config: {self.PYTHON_VERSION} | CUDA {self.CUDA_VERSION} | PyTorch {self.PYTORCH_VERSION}>"
\ No newline at end of file
@@ -306,6 +306,11 @@ class PackageRegistry:
         },
     }
     
+    # Filtered views of the static tables above - computed once per
+    # optional flag and reused (the install loop asks per environment)
+    _system_cache: Dict[bool, List[Package]] = {}
+    _python_cache: Dict[bool, List[Package]] = {}
+
     @classmethod
     def get_system_packages(
         cls,
@@ -313,23 +318,25 @@ class PackageRegistry:
         optional: bool = False
     ) -> List[Package]:
         """Get system packages for given package manager"""
-        packages = []
-        for pkg in cls.SYSTEM_PACKAGES.values():
-            if pkg.optional == optional:
-                packages.append(pkg)
-        return packages
-    
+        if optional not in cls._system_cache:
+            cls._system_cache[optional] = [
+                pkg for pkg in cls.SYSTEM_PACKAGES.values()
+                if pkg.optional == optional
+            ]
+        return cls._system_cache[optional]
+
     @classmethod
     def get_python_packages(
         cls,
         optional: bool = False
     ) -> List[Package]:
         """Get Python packages"""
-        packages = []
-        for pkg in cls.PYTHON_PACKAGES.values():
-            if pkg.optional == optional:
-                packages.append(pkg)
-        return packages
+        if optional not in cls._python_cache:
+            cls._python_cache[optional] = [
+                pkg for pkg in cls.PYTHON_PACKAGES.values()
+                if pkg.optional == optional
+            ]
+        return cls._python_cache[optional]
     
     @classmethod
     def get_mapped_name(
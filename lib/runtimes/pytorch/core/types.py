@@ -142,6 +142,12 @@ class SetupResult:
         return f"{status} ({self.phase.value}): {self.message}"
 
 
+# Flat value -> member maps: dict lookup instead of the slow Enum
+# __call__ coercion on hot paths (checkpoint loads, package manager dispatch)
+SETUP_PHASE_BY_VALUE = {m.value: m for m in SetupPhase}
+PACKAGE_MANAGER_BY_VALUE = {m.value: m for m in PackageManager}
+
+
 class ValidationError(Exception):
     """Custom validation error"""
     pass
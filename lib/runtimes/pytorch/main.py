@@ -12,9 +12,8 @@ from pathlib import Path
 SCRIPT_DIR = Path(__file__).parent.resolve()
 sys.path.insert(0, str(SCRIPT_DIR))
 
-from core.config import Config
-from core.logic import SetupOrchestrator
-from src.helpers import Logger, Banner
+# Framework imports happen inside main() after argument parsing, so
+# `--help` and bad invocations don't pay the full module import cost
 
 
 def parse_arguments():
@@ -70,7 +69,11 @@ Examples:
 def main():
     """Main entry point"""
     args = parse_arguments()
-    
+
+    from core.config import Config
+    from core.logic import SetupOrchestrator
+    from src.helpers import Logger, Banner
+
     # Initialize logger
     logger = Logger(
         verbose=args.verbose,
@@ -314,21 +314,23 @@ activate_env() {{
 
 # Available environments
 '''
-        
+
+        # Collect parts and join once rather than growing the string
+        parts = [script]
         for venv_name, description in self.config.VENVS.items():
             env_short = venv_name.replace('pytorch-', '')
-            script += f'alias activate-{env_short}="activate_env {venv_name}"\n'
-        
-        script += '''
+            parts.append(f'alias activate-{env_short}="activate_env {venv_name}"\n')
+
+        parts.append('''
 echo "Available environments:"
-'''
+''')
         for venv_name, description in self.config.VENVS.items():
             env_short = venv_name.replace('pytorch-', '')
-            script += f'echo "  activate-{env_short:<12} - {description}"\n'
-        
+            parts.append(f'echo "  activate-{env_short:<12} - {description}"\n')
+
         activate_path = self.paths.get('framework_root') / 'activate.zsh'
         with open(activate_path, 'w') as f:
-            f.write(script)
+            f.write(''.join(parts))
         activate_path.chmod(0o755)
     
     def generate_commands_md(self):
@@ -356,17 +358,19 @@ jupyter lab --port {self.config.JUPYTER_PORT}
 ## Available Environments
 
 '''
-        
+
+        # Collect parts and join once rather than growing the string
+        parts = [content]
         for venv_name, description in self.config.VENVS.items():
             env_short = venv_name.replace('pytorch-', '')
-            content += f'''### {venv_name}
+            parts.append(f'''### {venv_name}
 **Description:** {description}  
 **Activate:** `activate-{env_short}`  
 **Path:** `{self.config.VENV_ROOT}/{venv_name}`
 
-'''
-        
-        content += f'''## Training Templates
+''')
+
+        parts.append(f'''## Training Templates
 
 All templates are in: `{self.config.TEMPLATES_DIR}/`
 
@@ -479,11 +483,11 @@ pip install --force-reinstall torch transformers
 - Transformers Docs: https://huggingface.co/docs/transformers
 - PEFT Docs: https://huggingface.co/docs/peft
 - TRL Docs: https://huggingface.co/docs/trl
-'''
-        
+''')
+
         commands_path = self.paths.get('docs_dir') / 'COMMANDS.md'
         with open(commands_path, 'w') as f:
-            f.write(content)
+            f.write(''.join(parts))
         
         self.logger.success(f"✓ Generated {commands_path}")
     
@@ -6,10 +6,25 @@ Error handling, recovery, rollback, and checkpointing
 import signal
 import json
 from pathlib import Path
+
+# Prefer orjson for checkpoint serialization when installed - it is a
+# drop-in speedup; stdlib json remains the fallback
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+    _json_loads = json.loads
 from datetime import datetime
 from typing import Optional, Dict, Any
 
-from core.types import SetupPhase, SetupCheckpoint
+from core.types import SetupPhase, SetupCheckpoint, SETUP_PHASE_BY_VALUE
 from src.helpers import Logger
 
 
@@ -99,7 +114,7 @@ class ErrorHandler:
         checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(checkpoint_path, 'w') as f:
-            json.dump(checkpoint, f, indent=2)
+            f.write(_json_dumps(checkpoint))
         
         self.logger.debug(f"Checkpoint saved: {checkpoint_path}")
     
@@ -112,10 +127,10 @@ class ErrorHandler:
         
         try:
             with open(checkpoint_path, 'r') as f:
-                data = json.load(f)
+                data = _json_loads(f.read())
             
             return SetupCheckpoint(
-                phase=SetupPhase(data["phase"]),
+                phase=SETUP_PHASE_BY_VALUE[data["phase"]],
                 timestamp=data["timestamp"],
                 status=data["status"],
                 details=data
@@ -3,11 +3,15 @@ Helper Functions
 Logging, colors, formatting, and display utilities
 """
 
+import re
 import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+# Compiled once - stripped from every log line written to file
+_ANSI_RE = re.compile(r'\033\[\d+m')
+
 
 class Colors:
     """ANSI color codes"""
@@ -36,13 +40,15 @@ class Colors:
     @classmethod
     def strip(cls, text: str) -> str:
         """Remove color codes from text"""
-        import re
-        return re.sub(r'\033\[\d+m', '', text)
+        return _ANSI_RE.sub('', text)
 
 
 class Logger:
     """Logging utility with colors and file output"""
-    
+
+    # Every run writes a fresh setup-*.log; keep the directory bounded
+    KEEP_LOGS = 10
+
     def __init__(
         self,
         verbose: bool = False,
@@ -51,39 +57,58 @@ class Logger:
     ):
         self.verbose = verbose
         self.log_file = None
-        
+        self._log_fh = None
+
         if log_file:
             self.log_file = Path(log_file)
         elif script_dir:
             logs_dir = Path(script_dir) / "logs"
             logs_dir.mkdir(exist_ok=True)
+            self._prune_old_logs(logs_dir)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.log_file = logs_dir / f"setup-{timestamp}.log"
-        
+
         if self.log_file:
             self._write_log_header()
+
+    def _prune_old_logs(self, logs_dir: Path):
+        """Delete all but the newest setup logs (names sort by timestamp)"""
+        logs = sorted(logs_dir.glob("setup-*.log"))
+        for old in logs[:-self.KEEP_LOGS]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
     
     def _write_log_header(self):
-        """Write log file header"""
-        with open(self.log_file, 'w') as f:
-            f.write(f"={'='*80}\n")
-            f.write(f"AI Training Framework Setup Log\n")
-            f.write(f"Started: {datetime.now().isoformat()}\n")
-            f.write(f"{'='*80}\n\n")
-    
+        """Open the log file once (line-buffered) and write its header"""
+        self._log_fh = open(self.log_file, 'w', buffering=1)
+        self._log_fh.write(f"={'='*80}\n")
+        self._log_fh.write(f"AI Training Framework Setup Log\n")
+        self._log_fh.write(f"Started: {datetime.now().isoformat()}\n")
+        self._log_fh.write(f"{'='*80}\n\n")
+
+    def close(self):
+        """Close the log file handle"""
+        if self._log_fh:
+            self._log_fh.close()
+            self._log_fh = None
+
+    def __del__(self):
+        self.close()
+
     def _log(self, level: str, message: str, color: str = ""):
         """Internal logging method"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         colored_msg = f"{color}{message}{Colors.RESET}"
         plain_msg = Colors.strip(message)
-        
+
         # Print to console
         print(f"[{timestamp}] {colored_msg}")
-        
-        # Write to log file
-        if self.log_file:
-            with open(self.log_file, 'a') as f:
-                f.write(f"[{timestamp}] [{level}] {plain_msg}\n")
+
+        # Write to log file (handle stays open for the whole run)
+        if self._log_fh:
+            self._log_fh.write(f"[{timestamp}] [{level}] {plain_msg}\n")
     
     def info(self, message: str):
         """Info message"""
@@ -165,22 +190,28 @@ class ProgressBar:
         self.prefix = prefix
         self.width = width
         self.current = 0
-    
+        self._last_render = None
+
     def update(self, amount: int = 1):
         """Update progress"""
         self.current = min(self.current + amount, self.total)
         self._draw()
-    
+
     def _draw(self):
-        """Draw progress bar"""
+        """Draw progress bar (no-op while the rendering is unchanged)"""
         percent = self.current / self.total
         filled = int(self.width * percent)
         bar = "█" * filled + "░" * (self.width - filled)
         percent_str = f"{percent*100:.1f}%"
-        
-        sys.stdout.write(f"\r{self.prefix} [{bar}] {percent_str}")
+
+        render = f"\r{self.prefix} [{bar}] {percent_str}"
+        if render == self._last_render:
+            return
+        self._last_render = render
+
+        sys.stdout.write(render)
         sys.stdout.flush()
-        
+
         if self.current >= self.total:
             sys.stdout.write("\n")
 
@@ -10,9 +10,24 @@ from pathlib import Path
 from typing import List, Optional, Dict
 
 from core.packages import PackageRegistry
-from core.types import PackageManager
+from core.types import PackageManager, PACKAGE_MANAGER_BY_VALUE
 from src.helpers import Logger, ProgressBar
 
+# Package-manager command tables - built once, looked up per call
+PKG_UPDATE_COMMANDS = {
+    'apt': ['apt-get', 'update'],
+    'dnf': ['dnf', 'check-update'],
+    'pacman': ['pacman', '-Sy'],
+    'apk': ['apk', 'update'],
+}
+
+PKG_INSTALL_COMMANDS = {
+    'apt': ['apt-get', 'install', '-y'],
+    'dnf': ['dnf', 'install', '-y'],
+    'pacman': ['pacman', '-S', '--noconfirm'],
+    'apk': ['apk', 'add'],
+}
+
 
 class SystemUtils:
     """System utility functions"""
@@ -25,15 +40,8 @@ class SystemUtils:
     def update_package_manager(self) -> bool:
         """Update package manager"""
         pkg_mgr = self.config.PACKAGE_MANAGER
-        
-        commands = {
-            'apt': ['apt-get', 'update'],
-            'dnf': ['dnf', 'check-update'],
-            'pacman': ['pacman', '-Sy'],
-            'apk': ['apk', 'update'],
-        }
-        
-        cmd = commands.get(pkg_mgr)
+
+        cmd = PKG_UPDATE_COMMANDS.get(pkg_mgr)
         if not cmd:
             self.logger.error(f"Unknown package manager: {pkg_mgr}")
             return False
@@ -52,7 +60,7 @@ class SystemUtils:
     
     def install_system_packages(self) -> bool:
         """Install required system packages"""
-        pkg_mgr_enum = PackageManager[self.config.PACKAGE_MANAGER.upper()]
+        pkg_mgr_enum = PACKAGE_MANAGER_BY_VALUE[self.config.PACKAGE_MANAGER]
         packages = self.pkg_registry.get_system_packages(pkg_mgr_enum, optional=False)
         
         if not packages:
@@ -66,14 +74,7 @@ class SystemUtils:
         
         self.logger.info(f"Installing {len(pkg_names)} system packages...")
         
-        commands = {
-            'apt': ['apt-get', 'install', '-y'],
-            'dnf': ['dnf', 'install', '-y'],
-            'pacman': ['pacman', '-S', '--noconfirm'],
-            'apk': ['apk', 'add'],
-        }
-        
-        base_cmd = commands.get(self.config.PACKAGE_MANAGER)
+        base_cmd = PKG_INSTALL_COMMANDS.get(self.config.PACKAGE_MANAGER)
         if not base_cmd:
             return False
         
@@ -210,20 +211,14 @@ export LD_LIBRARY_PATH=$CUDA_HOME/lib64:$LD_LIBRARY_PATH
     def create_venv(self, venv_path: Path, venv_name: str) -> bool:
         """Create Python virtual environment"""
         try:
+            # --upgrade-deps upgrades pip during creation, folding the
+            # separate pip process into the venv one (one spawn per env)
             subprocess.run(
-                ['python3', '-m', 'venv', str(venv_path)],
+                ['python3', '-m', 'venv', '--upgrade-deps', str(venv_path)],
                 check=True,
                 capture_output=True
             )
-            
-            # Upgrade pip
-            pip_path = venv_path / 'bin' / 'pip'
-            subprocess.run(
-                [str(pip_path), 'install', '--upgrade', 'pip'],
-                check=True,
-                capture_output=True
-            )
-            
+
             self.logger.success(f"✓ Created {venv_name}")
             return True
         except Exception as e:
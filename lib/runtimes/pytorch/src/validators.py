@@ -12,6 +12,18 @@ from typing import Dict, Any, List, Optional, Tuple
 
 from src.helpers import Logger
 
+# Compiled once - matched on every version probe
+_PYTHON_VERSION_RE = re.compile(r'(\d+)\.(\d+)')
+_CUDA_RELEASE_RE = re.compile(r'release (\d+\.\d+)')
+
+# Package manager name -> binary to look for on PATH
+_MANAGER_BINARIES = {
+    'apt': 'apt-get',
+    'dnf': 'dnf',
+    'pacman': 'pacman',
+    'apk': 'apk',
+}
+
 
 class SystemValidator:
     """Validate system requirements"""
@@ -19,34 +31,42 @@ class SystemValidator:
     def __init__(self, config, logger: Logger):
         self.config = config
         self.logger = logger
-    
+        self._probe_cache = {}
+
+    def _probe(self, key: str, fn):
+        """Memoize a hardware probe - these shell out to external tools
+        and the answers do not change during a single setup run"""
+        if key not in self._probe_cache:
+            self._probe_cache[key] = fn()
+        return self._probe_cache[key]
+
     def validate_system(self) -> Dict[str, Any]:
         """Complete system validation"""
         errors = []
         warnings = []
         
         # Check RAM
-        ram_gb = self._get_ram_gb()
+        ram_gb = self._probe('ram_gb', self._get_ram_gb)
         if ram_gb < 8:
             errors.append(f"Insufficient RAM: {ram_gb}GB (minimum 8GB)")
-        
+
         # Check disk space
         disk_gb = self._get_free_disk_gb()
         if disk_gb < 50:
             errors.append(f"Insufficient disk space: {disk_gb}GB (minimum 50GB)")
-        
+
         # Check GPU
-        gpu_info = self._get_gpu_info()
+        gpu_info = self._probe('gpu', self._get_gpu_info)
         if not gpu_info['found']:
             warnings.append("No NVIDIA GPU detected")
         elif gpu_info['vram_gb'] < 4:
             warnings.append(f"Low GPU VRAM: {gpu_info['vram_gb']}GB")
-        
+
         # Check Python
-        python_version = self._get_python_version()
+        python_version = self._probe('python', self._get_python_version)
         if not python_version or python_version < (3, 8):
             errors.append(f"Python 3.8+ required (found: {python_version})")
-        
+
         # Check CUDA
         cuda_installed = self._check_cuda_installed()
         if not cuda_installed:
@@ -60,14 +80,15 @@ class SystemValidator:
     
     def get_system_info(self) -> Dict[str, Any]:
         """Get detailed system information"""
+        gpu_info = self._probe('gpu', self._get_gpu_info)
         return {
             "cpu": self._get_cpu_info(),
-            "ram_gb": self._get_ram_gb(),
-            "gpu": self._get_gpu_info()['name'],
-            "vram_gb": self._get_gpu_info()['vram_gb'],
+            "ram_gb": self._probe('ram_gb', self._get_ram_gb),
+            "gpu": gpu_info['name'],
+            "vram_gb": gpu_info['vram_gb'],
             "disk_gb": self._get_free_disk_gb(),
             "python": self._get_python_version_str(),
-            "cuda": self._get_cuda_version(),
+            "cuda": self._probe('cuda_version', self._get_cuda_version),
         }
     
     def check_cuda(self) -> Dict[str, Any]:
@@ -82,7 +103,7 @@ class SystemValidator:
                 "cuda_home": None,
             }
         
-        version = self._get_cuda_version()
+        version = self._probe('cuda_version', self._get_cuda_version)
         return {
             "installed": True,
             "version": version,
@@ -165,7 +186,7 @@ class SystemValidator:
                 capture_output=True,
                 text=True
             )
-            match = re.search(r'(\d+)\.(\d+)', result.stdout)
+            match = _PYTHON_VERSION_RE.search(result.stdout)
             if match:
                 return (int(match.group(1)), int(match.group(2)))
         except:
@@ -174,7 +195,7 @@ class SystemValidator:
     
     def _get_python_version_str(self) -> str:
         """Get Python version as string"""
-        version = self._get_python_version()
+        version = self._probe('python', self._get_python_version)
         if version:
             return f"{version[0]}.{version[1]}"
         return "Not found"
@@ -191,7 +212,7 @@ class SystemValidator:
                 capture_output=True,
                 text=True
             )
-            match = re.search(r'release (\d+\.\d+)', result.stdout)
+            match = _CUDA_RELEASE_RE.search(result.stdout)
             if match:
                 return match.group(1)
         except:
@@ -212,15 +233,8 @@ class SystemValidator:
     def validate_package_manager(self) -> bool:
         """Validate package manager is available"""
         pkg_mgr = self.config.PACKAGE_MANAGER
-        
-        managers = {
-            'apt': 'apt-get',
-            'dnf': 'dnf',
-            'pacman': 'pacman',
-            'apk': 'apk',
-        }
-        
-        cmd = managers.get(pkg_mgr)
+
+        cmd = _MANAGER_BINARIES.get(pkg_mgr)
         return shutil.which(cmd) is not None
     
     def check_internet_connectivity(self) -> bool:
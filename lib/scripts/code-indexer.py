@@ -20,45 +20,98 @@ INDEX_ROOTS = [
     "/home/admin/WORKSPACE/websites",
 ]
 
-# Exclude patterns
-EXCLUDE_DIRS = {
+# Exclude patterns (frozen - membership tests on every file)
+EXCLUDE_DIRS = frozenset({
     "node_modules", "target", ".git", "dist", "build",
     "__pycache__", ".next", ".venv", "venv", "coverage"
-}
+})
 
-EXCLUDE_EXTS = {
+EXCLUDE_EXTS = frozenset({
     ".pyc", ".so", ".dylib", ".o", ".a", ".class",
     ".png", ".jpg", ".jpeg", ".gif", ".ico", ".svg",
     ".woff", ".woff2", ".ttf", ".eot"
+})
+
+# Extension -> language tag for indexed files
+LANGUAGE_BY_EXT = {
+    '.rs': 'rust', '.go': 'go', '.py': 'python',
+    '.js': 'javascript', '.ts': 'typescript',
+    '.md': 'markdown', '.yaml': 'yaml', '.yml': 'yaml',
+    '.toml': 'toml', '.json': 'json', '.sh': 'bash'
 }
 
-def should_index(file_path):
-    """Check if file should be indexed"""
+# Suffix -> "looks like text" decision cache. guess_type is purely
+# extension-based, so one lookup per distinct suffix covers every file.
+_TEXT_SUFFIX_CACHE = {}
+
+def suffix_is_text(path):
+    """Check whether a path's suffix maps to a text (or unknown) mimetype"""
+    suffix = path.suffix.lower()
+    cached = _TEXT_SUFFIX_CACHE.get(suffix)
+    if cached is None:
+        mime_type, _ = mimetypes.guess_type(str(path))
+        cached = mime_type is None or mime_type.startswith('text')
+        _TEXT_SUFFIX_CACHE[suffix] = cached
+    return cached
+
+def iter_candidate_files(root):
+    """Walk root, pruning excluded directories at traversal time
+
+    Pruning in os.walk means node_modules/target/etc. are never entered,
+    instead of descending into them and rejecting every file one by one.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDE_DIRS]
+        for name in filenames:
+            yield Path(dirpath) / name
+
+def should_index(file_path, stat=None):
+    """Check if file should be indexed
+
+    Pass an os.stat result when the caller already has one so the file
+    is only stat'd once per traversal.
+    """
     path = Path(file_path)
 
-    # Check excluded directories
-    for part in path.parts:
-        if part in EXCLUDE_DIRS:
-            return False
-
     # Check excluded extensions
     if path.suffix in EXCLUDE_EXTS:
         return False
 
-    # Check if text file
-    mime_type, _ = mimetypes.guess_type(str(path))
-    if mime_type and not mime_type.startswith('text'):
+    # Check if text file (cached per suffix)
+    if not suffix_is_text(path):
         return False
 
     # Check file size (skip files > 1MB)
     try:
-        if path.stat().st_size > 1_000_000:
+        if stat is None:
+            stat = path.stat()
+        if stat.st_size > 1_000_000:
             return False
     except:
         return False
 
     return True
 
+# Rows buffered before each executemany flush during a build
+BATCH_SIZE = 200
+
+def _flush_rows(cur, replaced, rows):
+    """Write a batch of pending updates in two statements
+
+    Stale rows are deleted first so a replaced file never has two rows;
+    executemany keeps this at one round trip into sqlite per batch
+    instead of one per file.
+    """
+    if replaced:
+        cur.executemany("DELETE FROM code_files WHERE file_path = ?", replaced)
+        replaced.clear()
+    if rows:
+        cur.executemany("""
+            INSERT INTO code_files (file_path, content, language, size, modified)
+            VALUES (?, ?, ?, ?, ?)
+        """, rows)
+        rows.clear()
+
 def create_index():
     """Create SQLite FTS5 index"""
     # Ensure directory exists
@@ -67,12 +120,9 @@ def create_index():
     conn = sqlite3.connect(DB_PATH)
     cur = conn.cursor()
 
-    # Drop existing table
-    cur.execute("DROP TABLE IF EXISTS code_files")
-
-    # Create FTS5 table
+    # Create FTS5 table (kept across builds for incremental reindexing)
     cur.execute("""
-        CREATE VIRTUAL TABLE code_files USING fts5(
+        CREATE VIRTUAL TABLE IF NOT EXISTS code_files USING fts5(
             file_path UNINDEXED,
             content,
             language UNINDEXED,
@@ -82,47 +132,65 @@ def create_index():
         )
     """)
 
+    # Snapshot previous index state so unchanged files can be skipped
+    previous = {
+        path: (size, modified)
+        for path, size, modified in
+        cur.execute("SELECT file_path, size, modified FROM code_files")
+    }
+
     print(f"🔍 Indexing code files...")
     indexed = 0
     skipped = 0
+    unchanged = 0
+    seen = set()
+    pending_rows = []
+    pending_deletes = []
 
     for root in INDEX_ROOTS:
-        for file_path in Path(root).rglob('*'):
-            if not file_path.is_file():
+        for file_path in iter_candidate_files(root):
+            # Single stat per file, shared by the filter and the row data
+            try:
+                stat = file_path.stat()
+            except OSError:
+                skipped += 1
                 continue
 
-            if not should_index(file_path):
+            if not should_index(file_path, stat):
                 skipped += 1
                 continue
 
             try:
+                modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
+                key = str(file_path)
+                seen.add(key)
+
+                # Same size and mtime as last build - keep the old row
+                if previous.get(key) == (stat.st_size, modified):
+                    unchanged += 1
+                    continue
+
                 # Read file content
                 with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                     content = f.read()
 
                 # Determine language
-                ext_map = {
-                    '.rs': 'rust', '.go': 'go', '.py': 'python',
-                    '.js': 'javascript', '.ts': 'typescript',
-                    '.md': 'markdown', '.yaml': 'yaml', '.yml': 'yaml',
-                    '.toml': 'toml', '.json': 'json', '.sh': 'bash'
-                }
-                language = ext_map.get(file_path.suffix, 'unknown')
-
-                # Get file stats
-                stat = file_path.stat()
+                language = LANGUAGE_BY_EXT.get(file_path.suffix, 'unknown')
 
-                # Insert into index
-                cur.execute("""
-                    INSERT INTO code_files (file_path, content, language, size, modified)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    str(file_path),
+                # Queue the row; stale predecessors are deleted in the
+                # same batched flush
+                if key in previous:
+                    pending_deletes.append((key,))
+
+                pending_rows.append((
+                    key,
                     content,
                     language,
                     stat.st_size,
-                    datetime.fromtimestamp(stat.st_mtime).isoformat()
+                    modified
                 ))
+                if len(pending_rows) >= BATCH_SIZE:
+                    _flush_rows(cur, pending_deletes, pending_rows)
 
                 indexed += 1
                 if indexed % 100 == 0:
@@ -132,10 +200,18 @@ def create_index():
                 print(f"❌ Error indexing {file_path}: {e}")
                 continue
 
+    _flush_rows(cur, pending_deletes, pending_rows)
+
+    # Drop rows for files that no longer exist on disk
+    cur.executemany(
+        "DELETE FROM code_files WHERE file_path = ?",
+        [(stale,) for stale in set(previous) - seen]
+    )
+
     conn.commit()
     conn.close()
 
-    print(f"\n✅ Indexed {indexed} files (skipped {skipped})")
+    print(f"\n✅ Indexed {indexed} files ({unchanged} unchanged, {skipped} skipped)")
     print(f"📁 Database: {DB_PATH}")
     print(f"📊 Size: {Path(DB_PATH).stat().st_size / 1024 / 1024:.2f} MB")
 
@@ -4,7 +4,7 @@ Simple webhook server to trigger data collection
 Useful for CoDriver or external automation
 """
 
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import subprocess
 import json
 from urllib.parse import urlparse, parse_qs
@@ -87,7 +87,10 @@ class WebhookHandler(BaseHTTPRequestHandler):
 
 if __name__ == "__main__":
     PORT = 9007
-    server = HTTPServer(("127.0.0.1", PORT), WebhookHandler)
+    # Threading server: a collection run can take minutes, and the
+    # single-threaded server would block /health (and every other
+    # request) for the whole duration
+    server = ThreadingHTTPServer(("127.0.0.1", PORT), WebhookHandler)
     print(f"🌐 Data Collection Webhook running on http://127.0.0.1:{PORT}")
     print(f"")
     print(f"Endpoints:")
@@ -102,5 +105,8 @@ if __name__ == "__main__":
     try:
         server.serve_forever()
     except KeyboardInterrupt:
+        # serve_forever() has already returned here; shutdown() would just
+        # block waiting on a loop that is no longer running. Close the
+        # listening socket so the port is released immediately.
         print("\n👋 Shutting down webhook server")
-        server.shutdown()
+        server.server_close()
@@ -7,7 +7,7 @@ Generates markdown reports for trucking and housing data
 
 import requests
 import yaml
-import feedparser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
@@ -15,6 +15,22 @@ import sys
 from typing import List, Dict, Any
 import time
 
+# Use the libyaml C loader when the binding is available (10-20x faster
+# than the pure-Python parser, identical output)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Prefer orjson for the database payload encode; stdlib json is the fallback
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_dumps = json.dumps
+
 # Service endpoints
 DATA_COLLECTOR_URL = "http://localhost:9006"
 WEB_SCRAPER_URL = "http://localhost:9003"
@@ -24,14 +40,19 @@ class DataCollectorOrchestrator:
     def __init__(self, config_path: str):
         self.config = self.load_config(config_path)
         self.collected_items = []
+        # Shared session: scrape and database calls reuse connections
+        # instead of opening a new one per request
+        self.session = requests.Session()
 
     def load_config(self, path: str) -> Dict[str, Any]:
         """Load YAML configuration"""
         with open(path, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YamlLoader)
 
     def collect_rss_feeds(self) -> List[Dict[str, Any]]:
         """Collect data from RSS feeds"""
+        import feedparser  # Slow import - only needed for RSS collection
+
         items = []
 
         feeds = self.config.get('sources', {}).get('rss_feeds', [])
@@ -66,53 +87,53 @@ class DataCollectorOrchestrator:
 
     def collect_web_scrapes(self) -> List[Dict[str, Any]]:
         """Collect data via web scraper agent"""
-        items = []
-
         scrapes = self.config.get('sources', {}).get('web_scrapes', [])
         print(f"🕷️  Scraping {len(scrapes)} web sources...")
 
-        for scrape_config in scrapes:
-            print(f"  ├─ {scrape_config['name']}...")
+        if not scrapes:
+            return []
 
-            # Create scraper job via web-scraper agent
-            try:
-                payload = {
-                    "config": {
-                        "id": scrape_config['id'],
-                        "name": scrape_config['name'],
-                        "url": scrape_config['url'],
-                        "selectors": scrape_config.get('selectors', {}),
-                        "schedule_seconds": 0,  # Run once
-                        "enabled": True
-                    }
-                }
+        # Scrapes are independent fetches - run them concurrently so total
+        # time is the slowest source, not the sum of every timeout
+        with ThreadPoolExecutor(max_workers=min(8, len(scrapes))) as executor:
+            results = list(executor.map(self._scrape_source, scrapes))
 
-                # Note: In production, we'd call the web-scraper service
-                # For now, simulate with direct requests
-                response = requests.get(scrape_config['url'], timeout=30)
+        items = []
+        for scrape_config, (item, status) in zip(scrapes, results):
+            if item is not None:
+                items.append(item)
+                print(f"  ├─ {scrape_config['name']}: ✅ Scraped successfully")
+            else:
+                print(f"  ├─ {scrape_config['name']}: ❌ {status}")
 
-                if response.status_code == 200:
-                    item = {
-                        'title': f"Scraped: {scrape_config['name']}",
-                        'url': scrape_config['url'],
-                        'source': scrape_config['name'],
-                        'category': scrape_config['category'],
-                        'published_at': datetime.now().isoformat(),
-                        'content': f"Successfully scraped {len(response.text)} bytes",
-                        'metadata': {
-                            'status_code': response.status_code,
-                            'content_type': response.headers.get('content-type', ''),
-                        }
-                    }
-                    items.append(item)
-                    print(f"  └─ ✅ Scraped successfully")
-                else:
-                    print(f"  └─ ❌ HTTP {response.status_code}")
+        return items
 
-            except Exception as e:
-                print(f"  └─ ❌ Error: {e}")
+    def _scrape_source(self, scrape_config: Dict[str, Any]) -> tuple:
+        """Fetch one configured source; returns (item or None, status text)"""
+        try:
+            # Note: In production, we'd call the web-scraper service
+            # For now, simulate with direct requests
+            response = self.session.get(scrape_config['url'], timeout=30)
 
-        return items
+            if response.status_code != 200:
+                return None, f"HTTP {response.status_code}"
+
+            item = {
+                'title': f"Scraped: {scrape_config['name']}",
+                'url': scrape_config['url'],
+                'source': scrape_config['name'],
+                'category': scrape_config['category'],
+                'published_at': datetime.now().isoformat(),
+                'content': f"Successfully scraped {len(response.content)} bytes",
+                'metadata': {
+                    'status_code': response.status_code,
+                    'content_type': response.headers.get('content-type', ''),
+                }
+            }
+            return item, "ok"
+
+        except Exception as e:
+            return None, f"Error: {e}"
 
     def collect_search_queries(self) -> List[Dict[str, Any]]:
         """Execute search queries via web-search agent"""
@@ -121,11 +142,17 @@ class DataCollectorOrchestrator:
         queries = self.config.get('sources', {}).get('search_queries', [])
         print(f"🔍 Executing {len(queries)} search queries...")
 
+        # Format the template values once - every query in this batch
+        # should use the same date anyway
+        now = datetime.now()
+        date_str = now.strftime('%Y-%m-%d')
+        month_str = now.strftime('%B')
+
         for query_config in queries:
             query = query_config['query'].format(
-                date=datetime.now().strftime('%Y-%m-%d'),
-                month=datetime.now().strftime('%B'),
-                year=datetime.now().year
+                date=date_str,
+                month=month_str,
+                year=now.year
             )
 
             print(f"  ├─ \"{query}\"...")
@@ -152,6 +179,10 @@ class DataCollectorOrchestrator:
         """Generate markdown report from collected items"""
         print(f"\n📝 Generating markdown report...")
 
+        # One timestamp for the whole report - header and footer should
+        # agree, and datetime.now()/strftime are not free per call
+        generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
         # Group by category
         grouped = {}
         for item in items:
@@ -162,7 +193,7 @@ class DataCollectorOrchestrator:
 
         # Create markdown
         md = f"# {self.config.get('title', 'Data Collection Report')}\n\n"
-        md += f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  \n"
+        md += f"**Generated**: {generated_at}  \n"
         md += f"**Total Items**: {len(items)}  \n\n"
         md += "---\n\n"
 
@@ -199,7 +230,7 @@ class DataCollectorOrchestrator:
                 md += "---\n\n"
 
         # Footer
-        md += f"\n*Generated by AI Data Collector at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
+        md += f"\n*Generated by AI Data Collector at {generated_at}*\n"
 
         # Write to file
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -217,24 +248,23 @@ class DataCollectorOrchestrator:
         print(f"\n💾 Saving to SurrealDB table: {table}...")
 
         try:
-            for item in items:
-                payload = {
-                    "query": f"CREATE {table} CONTENT {json.dumps(item)}"
+            # One statement, one JSON blob: INSERT accepts an array, so
+            # the whole batch serializes and parses as a single payload
+            query = f"INSERT INTO {table} {_json_dumps(items)}"
+
+            response = self.session.post(
+                f"{SURREAL_DB_URL}/sql",
+                json={"query": query},
+                headers={
+                    "NS": "workspace",
+                    "DB": "data_collections"
                 }
+            )
 
-                response = requests.post(
-                    f"{SURREAL_DB_URL}/sql",
-                    json=payload,
-                    headers={
-                        "NS": "workspace",
-                        "DB": "data_collections"
-                    }
-                )
-
-                if response.status_code != 200:
-                    print(f"  ❌ Failed to save item: {response.text}")
-
-            print(f"✅ Saved {len(items)} items to database")
+            if response.status_code != 200:
+                print(f"  ❌ Failed to save batch: {response.text}")
+            else:
+                print(f"✅ Saved {len(items)} items to database")
 
         except Exception as e:
             print(f"❌ Database error: {e}")
@@ -3,53 +3,74 @@ import requests
 import json
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 
 class OllamaCluster:
     def __init__(self, nodes: List[str]):
         self.nodes = nodes
-    
+        self._inventory = None
+        # One session for all node calls - reuses TCP connections
+        # instead of handshaking per request
+        self.session = requests.Session()
+
+    def _map_nodes(self, fn):
+        """Run fn(node) across all nodes in parallel - the queries are
+        independent HTTP calls, so total time is the slowest node, not the sum"""
+        if not self.nodes:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(16, len(self.nodes))) as ex:
+            return dict(zip(self.nodes, ex.map(fn, self.nodes)))
+
+    def _fetch_models(self, node: str) -> List[str]:
+        try:
+            r = self.session.get(f"http://{node}:11434/api/tags", timeout=2)
+            return [m['name'] for m in r.json()['models']]
+        except:
+            return []
+
+    def get_inventory(self, refresh: bool = False) -> Dict[str, List]:
+        """Per-node model inventory, fetched once per cluster instance
+        so repeated list/find calls don't re-query every node"""
+        if self._inventory is None or refresh:
+            self._inventory = self._map_nodes(self._fetch_models)
+        return self._inventory
+
     def list_all_models(self) -> Dict[str, List]:
-        inventory = {}
-        for node in self.nodes:
-            try:
-                r = requests.get(f"http://{node}:11434/api/tags", timeout=2)
-                inventory[node] = [m['name'] for m in r.json()['models']]
-            except:
-                inventory[node] = []
-        return inventory
-    
+        return self.get_inventory()
+
     def find_model(self, model: str) -> List[str]:
-        nodes_with_model = []
-        for node in self.nodes:
-            try:
-                r = requests.get(f"http://{node}:11434/api/tags", timeout=2)
-                if any(model in m['name'] for m in r.json()['models']):
-                    nodes_with_model.append(node)
-            except:
-                pass
-        return nodes_with_model
+        inventory = self.get_inventory()
+        return [
+            node for node, models in inventory.items()
+            if any(model in m for m in models)
+        ]
     
-    def generate(self, node: str, model: str, prompt: str, stream: bool = False):
+    def generate(self, node: str, model: str, prompt: str) -> str:
+        """Blocking generate - returns the full response text"""
+        url = f"http://{node}:11434/api/generate"
+        data = {"model": model, "prompt": prompt, "stream": False}
+        r = self.session.post(url, json=data)
+        return r.json()['response']
+
+    def generate_stream(self, node: str, model: str, prompt: str):
+        """Streaming generate - yields parsed chunks as they arrive
+        instead of waiting for the model to finish the whole response"""
         url = f"http://{node}:11434/api/generate"
-        data = {"model": model, "prompt": prompt, "stream": stream}
-        r = requests.post(url, json=data, stream=stream)
-        if stream:
+        data = {"model": model, "prompt": prompt, "stream": True}
+        with self.session.post(url, json=data, stream=True) as r:
             for line in r.iter_lines():
                 if line:
                     yield json.loads(line)
-        else:
-            return r.json()['response']
     
     def health_check(self) -> Dict[str, bool]:
-        status = {}
-        for node in self.nodes:
+        def check(node):
             try:
-                requests.get(f"http://{node}:11434/api/tags", timeout=1)
-                status[node] = True
+                self.session.get(f"http://{node}:11434/api/tags", timeout=1)
+                return True
             except:
-                status[node] = False
-        return status
+                return False
+        return self._map_nodes(check)
 
 if __name__ == "__main__":
     nodes = os.environ.get('OLLAMA_NODES', '').split(',')